@@ -219,3 +219,60 @@ class TestArgcomplete:
         assert completions > {"--Application.", "--MainApp."}
         assert "--SubApp1." not in completions
         assert "--SubApp2." not in completions
+
+
+def test_match_class_completions():
+    from traitlets.config.argcomplete_config import ExtendedCompletionFinder
+
+    class Bar(Configurable):
+        pass
+
+    class BarBaz(Configurable):
+        pass
+
+    class Foo(Configurable):
+        pass
+
+    finder = ExtendedCompletionFinder()  # type:ignore[no-untyped-call]
+    finder.config_classes = [Foo, BarBaz, Bar]
+    assert finder.match_class_completions("") == [
+        (Foo, "--Foo."),
+        (BarBaz, "--BarBaz."),
+        (Bar, "--Bar."),
+    ]
+    assert finder.match_class_completions("--Ba") == [(BarBaz, "--BarBaz."), (Bar, "--Bar.")]
+    assert finder.match_class_completions("--Bar") == [(BarBaz, "--BarBaz."), (Bar, "--Bar.")]
+    assert finder.match_class_completions("--Bar.tr") == [(Bar, "--Bar.")]
+    assert finder.match_class_completions("--Qux") == []
+    assert finder.match_class_completions("--Qux.") == []
+
+    # callers may modify the result without affecting later matches
+    finder.match_class_completions("").clear()
+    assert len(finder.match_class_completions("")) == 3
+
+    finder.config_classes = [Bar]
+    assert finder.match_class_completions("--") == [(Bar, "--Bar.")]
+
+    # in-place changes are picked up as well
+    finder.config_classes.append(Foo)
+    assert finder.match_class_completions("--") == [(Bar, "--Bar."), (Foo, "--Foo.")]
+
+
+def test_inject_class_to_parser_once():
+    import argparse
+
+    from traitlets.config.argcomplete_config import ExtendedCompletionFinder
+
+    class Foo(Configurable):
+        bar = Unicode().tag(config=True)
+
+    finder = ExtendedCompletionFinder()  # type:ignore[no-untyped-call]
+    finder._parser = argparse.ArgumentParser()
+    finder.inject_class_to_parser(Foo)
+    # a second injection would otherwise conflict with the existing --Foo.bar
+    finder.inject_class_to_parser(Foo)
+    assert "--Foo.bar" in finder._parser._option_string_actions
+
+    finder._parser = argparse.ArgumentParser()
+    finder.inject_class_to_parser(Foo)
+    assert "--Foo.bar" in finder._parser._option_string_actions
@@ -86,6 +86,28 @@ class TestFileCL(TestCase):
         config = cl.load_config()
         self._check_conf(config)
 
+    def test_python_reload(self):
+        fd, fname = mkstemp(".py")
+        with os.fdopen(fd, "w") as f:
+            f.write(pyfile)
+        self._check_conf(PyFileConfigLoader(fname, log=log).load_config())
+        # loading again reuses the compiled file, but still gives a fresh config
+        config = PyFileConfigLoader(fname, log=log).load_config()
+        self._check_conf(config)
+        config.a = 5
+        self._check_conf(PyFileConfigLoader(fname, log=log).load_config())
+        # changes to the file are picked up
+        with open(fname, "a") as f:
+            f.write("c.a = 30\n")
+        config = PyFileConfigLoader(fname, log=log).load_config()
+        self.assertEqual(config.a, 30)
+        # including same-size edits, which timestamps may not reveal
+        with open(fname, "w") as f:
+            f.write(pyfile + "c.a = 40\n")
+        config = PyFileConfigLoader(fname, log=log).load_config()
+        self.assertEqual(config.a, 40)
+        os.remove(fname)
+
     def test_json(self):
         fd, fname = mkstemp(".json", prefix="μnïcø∂e")
         f = os.fdopen(fd, "w")
@@ -169,6 +191,16 @@ class TestFileCL(TestCase):
             },
         )
 
+    def test_collision_toplevel_values(self):
+        a = Config()
+        b = Config()
+        a.foo = [1, 2]
+        b.foo = [1, 3]
+        a.bar = 1
+        b.bar = 2
+        self.assertEqual(a.collisions(b), {})
+        self.assertEqual(b.collisions(a), {})
+
     def test_v2raise(self):
         fd, fname = mkstemp(".json", prefix="μnïcø∂e")
         f = os.fdopen(fd, "w")
@@ -558,6 +590,11 @@ class TestConfig(TestCase):
         self.assertIn("Foo.baz", c1)
         self.assertIn("Foo.bar", c2)
         self.assertNotIn("Foo.bar", c1)
+        c3 = Config({"Foo": {"Bar": {"baz": 3}}})
+        self.assertIn("Foo.Bar.baz", c3)
+        self.assertNotIn("Foo.Bar.bar", c3)
+        self.assertNotIn("Foo.Baz.bar", c3)
+        self.assertNotIn("Baz", c3.Foo)
 
     def test_pickle_config(self):
         cfg = Config()
@@ -566,6 +603,14 @@ class TestConfig(TestCase):
         cfg2 = pickle.loads(pcfg)
         self.assertEqual(cfg2, cfg)
 
+    def test_pickle_lazy_config(self):
+        cfg = Config()
+        cfg.Foo.bar.append(1)
+        cfg2 = pickle.loads(pickle.dumps(cfg))
+        lazy = cfg2.Foo.bar
+        assert isinstance(lazy, LazyConfigValue)
+        self.assertEqual(lazy.get_value([0]), [0, 1])
+
     def test_getattr_section(self):
         cfg = Config()
         self.assertNotIn("Foo", cfg)
@@ -751,3 +796,17 @@ class TestConfig(TestCase):
         c.merge(c2)
 
         self.assertEqual(c.Foo.trait._update, {"a": 1, "z": 26, "b": 1})
+
+    def test_lazy_get_value_copies_initial(self):
+        lazy = LazyConfigValue()
+        lazy.append(3)
+        initial = [1, 2]
+        self.assertEqual(lazy.get_value(initial), [1, 2, 3])
+        self.assertEqual(initial, [1, 2])
+
+        lazy = LazyConfigValue()
+        lazy.append([3])
+        nested = [[1], [2]]
+        value = lazy.get_value(nested)
+        self.assertEqual(value, [[1], [2], [3]])
+        self.assertIsNot(value[0], nested[0])
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from traitlets.utils.text import indent, wrap_paragraphs
+
+
+def test_indent():
+    assert indent("a\n\n  b\n") == "    a\n\n      b\n"
+    assert indent("a\n \nb") == "    a\n \n    b"
+
+
+def test_wrap_paragraphs():
+    text = """
+    first paragraph with several words in it
+
+    second paragraph
+      with indented formatting
+
+
+    third
+    """
+    assert wrap_paragraphs(text, 20) == [
+        "first paragraph with\nseveral words in it",
+        "second paragraph\n  with indented formatting",
+        "third",
+    ]
+
+
+def test_wrap_paragraphs_empty():
+    assert wrap_paragraphs("") == [""]
@@ -75,6 +75,8 @@ subcommand_description = """
 Subcommands are launched as `{app} cmd [args]`. For information on using
 subcommand 'cmd', do: `{app} cmd -h`.
 """
+# a subcommand name, as opposed to a flag or class parameter
+subcommand_pattern = re.compile(r"^\w(\-?\w)*$")
 # get running program name
 
 # -----------------------------------------------------------------------------
@@ -851,7 +853,7 @@ class Application(SingletonConfigurable):
         if self.subcommands and len(argv) > 0:
             # we have subcommands, and one may have been specified
             subc, subargv = argv[0], argv[1:]
-            if re.match(r"^\w(\-?\w)*$", subc) and subc in self.subcommands:
+            if subc in self.subcommands and subcommand_pattern.match(subc):
                 # it's a subcommand, and *not* a flag or class parameter
                 self._handle_argcomplete_for_subcommand()
                 return self.initialize_subcommand(subc, subargv)
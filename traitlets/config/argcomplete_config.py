@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 import os
 import typing as t
 
@@ -98,8 +99,36 @@ class ExtendedCompletionFinder(CompletionFinder):
     """
 
     _parser: argparse.ArgumentParser
-    config_classes: t.List[t.Any] = []  # Configurables
+    config_classes: t.Sequence[t.Any] = ()  # Configurables
     subcommands: t.List[str] = []
+    # (config_classes, class completions, sorted options, their positions) for the
+    # last seen config_classes, see _get_class_completions
+    _class_completions_cache: t.Optional[
+        t.Tuple[t.Any, t.List[t.Tuple[t.Any, str]], t.List[str], t.List[int]]
+    ] = None
+    # classes whose traits have been added to _injected_parser
+    _injected_parser: t.Optional[argparse.ArgumentParser] = None
+    _injected_classes: t.Set[t.Any]
+
+    def _get_class_completions(
+        self,
+    ) -> t.Tuple[t.List[t.Tuple[t.Any, str]], t.List[str], t.List[int]]:
+        """Get the --{class}. option for each of our Configurable classes
+
+        Returns the ``(cls, option)`` pairs in config_classes order, along with
+        the options sorted for prefix search and each one's position in the former.
+        These are only recomputed when config_classes changes.
+        """
+        # snapshot config_classes, so in-place changes to it are picked up too
+        config_classes = tuple(self.config_classes)
+        cache = self._class_completions_cache
+        if cache is None or cache[0] != config_classes:
+            class_completions = [(cls, f"--{cls.__name__}.") for cls in config_classes]
+            order = sorted(range(len(class_completions)), key=lambda i: class_completions[i][1])
+            sorted_options = [class_completions[i][1] for i in order]
+            cache = (config_classes, class_completions, sorted_options, order)
+            self._class_completions_cache = cache
+        return cache[1], cache[2], cache[3]
 
     def match_class_completions(self, cword_prefix: str) -> t.List[t.Tuple[t.Any, str]]:
         """Match the word to be completed against our Configurable classes
@@ -107,16 +136,20 @@ class ExtendedCompletionFinder(CompletionFinder):
         Check if cword_prefix could potentially match against --{class}. for any class
         in Application.classes.
         """
-        class_completions = [(cls, f"--{cls.__name__}.") for cls in self.config_classes]
-        matched_completions = class_completions
-        if "." in cword_prefix:
-            cword_prefix = cword_prefix[: cword_prefix.index(".") + 1]
-            matched_completions = [(cls, c) for (cls, c) in class_completions if c == cword_prefix]
+        class_completions, sorted_options, order = self._get_class_completions()
+        head, dot, _ = cword_prefix.partition(".")
+        if dot:
+            cword_prefix = head + dot
+            lo = bisect.bisect_left(sorted_options, cword_prefix)
+            hi = bisect.bisect_right(sorted_options, cword_prefix, lo)
         elif len(cword_prefix) > 0:
-            matched_completions = [
-                (cls, c) for (cls, c) in class_completions if c.startswith(cword_prefix)
-            ]
-        return matched_completions
+            lo = hi = bisect.bisect_left(sorted_options, cword_prefix)
+            while hi < len(sorted_options) and sorted_options[hi].startswith(cword_prefix):
+                hi += 1
+        else:
+            return list(class_completions)
+        # report matches in config_classes order
+        return [class_completions[i] for i in sorted(order[lo:hi])]
 
     def inject_class_to_parser(self, cls: t.Any) -> None:
         """Add dummy arguments to our ArgumentParser for the traits of this class
@@ -128,23 +161,32 @@ class ExtendedCompletionFinder(CompletionFinder):
 
         This method should be called selectively to reduce runtime overhead and to avoid
         spamming options across all of Application.classes.
+        Classes which have already been added to the current parser are skipped.
         """
-        try:
-            for traitname, trait in cls.class_traits(config=True).items():
-                completer = trait.metadata.get("argcompleter") or getattr(
-                    trait, "argcompleter", None
-                )
-                multiplicity = trait.metadata.get("multiplicity")
-                self._parser.add_argument(  # type: ignore[attr-defined]
-                    f"--{cls.__name__}.{traitname}",
-                    type=str,
-                    help=trait.help,
-                    nargs=multiplicity,
-                    # metavar=traitname,
-                ).completer = completer
-                # argcomplete.debug(f"added --{cls.__name__}.{traitname}")
-        except AttributeError:
-            pass
+        if not hasattr(cls, "class_traits"):
+            # not a HasTraits class, nothing to add
+            return
+        if self._injected_parser is not self._parser:
+            self._injected_parser = self._parser
+            self._injected_classes = set()
+        elif cls in self._injected_classes:
+            return
+        self._injected_classes.add(cls)
+        prefix = f"--{cls.__name__}."
+        for traitname, trait in cls.class_traits(config=True).items():
+            metadata = trait.metadata
+            completer = metadata.get("argcompleter")
+            if not completer:
+                completer = getattr(trait, "argcompleter", None)
+            multiplicity = metadata.get("multiplicity")
+            self._parser.add_argument(  # type: ignore[attr-defined]
+                prefix + traitname,
+                type=str,
+                help=trait.help,
+                nargs=multiplicity,
+                # metavar=traitname,
+            ).completer = completer
+            # argcomplete.debug("added " + prefix + traitname)
 
     def _get_completions(
         self, comp_words: t.List[str], cword_prefix: str, *args: t.Any
@@ -165,7 +207,7 @@ class ExtendedCompletionFinder(CompletionFinder):
         # a known Class, if we are then add the Class config traits to our ArgumentParser.
         prefix_chars = self._parser.prefix_chars
         is_option = len(cword_prefix) > 0 and cword_prefix[0] in prefix_chars
-        if is_option:
+        if self.config_classes and is_option:
             # If we are currently completing an option, check if it could
             # match with any of the --Class. completions. If there's exactly
             # one matched class, then expand out the --Class.trait options.
@@ -173,13 +215,13 @@ class ExtendedCompletionFinder(CompletionFinder):
             if len(matched_completions) == 1:
                 matched_cls = matched_completions[0][0]
                 self.inject_class_to_parser(matched_cls)
-        elif len(comp_words) > 0 and "." in comp_words[-1] and not is_option:
+        elif self.config_classes and comp_words and "." in comp_words[-1]:
             # If not an option, perform a hacky check to see if we are completing
             # an argument for an already present --Class.trait option. Search backwards
             # for last option (based on last word starting with prefix_chars), and see
             # if it is of the form --Class.trait. Note that if multiplicity="+", these
             # arguments might conflict with positional arguments.
-            for prev_word in comp_words[::-1]:
+            for prev_word in reversed(comp_words):
                 if len(prev_word) > 0 and prev_word[0] in prefix_chars:
                     matched_completions = self.match_class_completions(prev_word)
                     if matched_completions:
@@ -207,7 +249,7 @@ class ExtendedCompletionFinder(CompletionFinder):
         """Overridden to add --Class. completions when appropriate"""
         completions: t.List[str]
         completions = super()._get_option_completions(parser, cword_prefix)  # type:ignore[no-untyped-call]
-        if cword_prefix.endswith("."):
+        if cword_prefix.endswith(".") or not self.config_classes:
             return completions
 
         matched_completions = self.match_class_completions(cword_prefix)
@@ -11,6 +11,7 @@ import json
 import os
 import re
 import sys
+import types
 import typing as t
 from logging import Logger
 
@@ -82,6 +83,29 @@ def execfile(fname: str, glob: dict[str, Any]) -> None:
         exec(compile(f.read(), fname, "exec"), glob, glob)  # noqa: S102
 
 
+# leaf types that never need copying, so containers of only these can be shallow-copied
+_ATOMIC_TYPES = frozenset({str, bytes, int, float, complex, bool, type(None)})
+
+
+def _fast_copy(value: t.Any) -> t.Any:
+    """Copy a container value that is about to be mutated
+
+    Plain lists, dicts, and sets holding only atomic values are shallow-copied,
+    which is equivalent to, but much cheaper than, ``copy.deepcopy``.
+    """
+    value_type = type(value)
+    if value_type in _ATOMIC_TYPES or value_type in (tuple, frozenset):
+        # immutable containers can't be mutated in place either
+        return value
+    if value_type in (list, set):
+        if all(type(v) in _ATOMIC_TYPES for v in value):
+            return value.copy()
+    elif value_type is dict:
+        if all(type(v) in _ATOMIC_TYPES for v in value.values()):
+            return value.copy()
+    return copy.deepcopy(value)
+
+
 class LazyConfigValue(HasTraits):
     """Proxy object for exposing methods on configurable containers
 
@@ -177,7 +201,11 @@ class LazyConfigValue(HasTraits):
         """
         if self._value is not None:
             return self._value  # type:ignore[unreachable]
-        value = copy.deepcopy(initial)
+        if not (self._extend or self._prepend or self._inserts or self._update):
+            # nothing to apply, so initial is never mutated and needn't be copied
+            self._value = initial
+            return initial
+        value = _fast_copy(initial)
         if isinstance(value, list):
             for idx, obj in self._inserts:
                 value.insert(idx, obj)
@@ -216,11 +244,17 @@ class LazyConfigValue(HasTraits):
             return f"<{self.__class__.__name__} {self.to_dict()!r}>"
 
 
+@functools.lru_cache(maxsize=1024)
 def _is_section_key(key: str) -> bool:
     """Is a Config key a section name (does it start with a capital)?"""
     return bool(key and key[0].upper() == key[0] and not key.startswith("_"))
 
 
+def _intern_section_key(key: str) -> str:
+    """Intern a section name, which is looked up over and over across configs"""
+    return sys.intern(key) if type(key) is str else key
+
+
 class Config(dict):  # type:ignore[type-arg]
     """An attribute-based dict that can do smart merges.
 
@@ -237,7 +271,8 @@ class Config(dict):  # type:ignore[type-arg]
 
     def __init__(self, *args: t.Any, **kwds: t.Any) -> None:
         dict.__init__(self, *args, **kwds)
-        self._ensure_subconfig()
+        if args or kwds:
+            self._ensure_subconfig()
 
     def _ensure_subconfig(self) -> None:
         """ensure that sub-dicts that should be Config objects are
@@ -245,10 +280,10 @@ class Config(dict):  # type:ignore[type-arg]
         casts dicts that are under section keys to Config objects,
         which is necessary for constructing Config objects from dict literals.
         """
-        for key in self:
-            obj = self[key]
-            if _is_section_key(key) and isinstance(obj, dict) and not isinstance(obj, Config):
-                setattr(self, key, Config(obj))
+        for key, obj in self.items():
+            if isinstance(obj, dict) and not isinstance(obj, Config) and _is_section_key(key):
+                # replacing a value doesn't resize the dict, so it is safe mid-iteration
+                dict.__setitem__(self, key, Config(obj))
 
     def _merge(self, other: t.Any) -> None:
         """deprecated alias, use Config.merge()"""
@@ -256,21 +291,24 @@ class Config(dict):  # type:ignore[type-arg]
 
     def merge(self, other: t.Any) -> None:
         """merge another config object into this one"""
-        to_update = {}
+        # bypass our own __contains__/__getitem__/__setitem__,
+        # which would parse dotted keys, auto-create missing values, and re-check keys
+        contains = dict.__contains__
+        getitem = dict.__getitem__
+        setitem = dict.__setitem__
         for k, v in other.items():
-            if k not in self:
-                to_update[k] = v
+            if not contains(self, k):
+                setitem(self, k, v)
             else:  # I have this key
-                if isinstance(v, Config) and isinstance(self[k], Config):
+                mine = getitem(self, k)
+                if isinstance(v, Config) and isinstance(mine, Config):
                     # Recursively merge common sub Configs
-                    self[k].merge(v)
+                    mine.merge(v)
                 elif isinstance(v, LazyConfigValue):
-                    self[k] = v.merge_into(self[k])
+                    self[k] = v.merge_into(mine)
                 else:
                     # Plain updates for non-Configs
-                    to_update[k] = v
-
-        self.update(to_update)
+                    setitem(self, k, v)
 
     def collisions(self, other: Config) -> dict[str, t.Any]:
         """Check for collisions between two config objects.
@@ -281,26 +319,37 @@ class Config(dict):  # type:ignore[type-arg]
         An empty dict indicates no collisions.
         """
         collisions: dict[str, t.Any] = {}
-        for section in self:
-            if section not in other:
+        for section, mine in self.items():
+            if not dict.__contains__(other, section):
+                continue
+            theirs = dict.__getitem__(other, section)
+            if not isinstance(mine, dict) or not isinstance(theirs, dict):
+                # only sections can collide, not top-level values
                 continue
-            mine = self[section]
-            theirs = other[section]
-            for key in mine:
-                if key in theirs and mine[key] != theirs[key]:
+            if not mine or not theirs:
+                continue
+            for key, value in mine.items():
+                if key not in theirs:
+                    continue
+                their_value = theirs[key]
+                if value != their_value:
                     collisions.setdefault(section, {})
-                    collisions[section][key] = f"{mine[key]!r} ignored, using {theirs[key]!r}"
+                    collisions[section][key] = f"{value!r} ignored, using {their_value!r}"
         return collisions
 
     def __contains__(self, key: t.Any) -> bool:
         # allow nested contains of the form `"Section.key" in config`
-        if "." in key:
-            first, remainder = key.split(".", 1)
-            if first not in self:
+        section: t.Any = self
+        first, sep, remainder = key.partition(".")
+        while sep:
+            if not dict.__contains__(section, first):
                 return False
-            return remainder in self[first]
+            section = dict.__getitem__(section, first)
+            if not isinstance(section, Config):
+                return remainder in section
+            first, sep, remainder = remainder.partition(".")
 
-        return super().__contains__(key)
+        return dict.__contains__(section, first)
 
     # .has_key is deprecated for dictionaries.
     has_key = __contains__
@@ -317,30 +366,34 @@ class Config(dict):  # type:ignore[type-arg]
     def __deepcopy__(self, memo: t.Any) -> Config:
         new_config = type(self)()
         for key, value in self.items():
-            if isinstance(value, (Config, LazyConfigValue)):
-                # deep copy config objects
+            if type(value) in _ATOMIC_TYPES:
+                # immutable leaves, the bulk of most configs, are shared as is
+                pass
+            elif isinstance(value, Config):
+                # configs are trees, so recurse without the copy module's dispatch
+                value = value.__deepcopy__(memo)
+            elif isinstance(value, LazyConfigValue):
                 value = copy.deepcopy(value, memo)
-            elif type(value) in {dict, list, set, tuple}:
-                # shallow copy plain container traits
-                value = copy.copy(value)
-            new_config[key] = value
+            elif type(value) in (dict, list, set):
+                # shallow copy plain container traits, tuples are immutable
+                value = value.copy()
+            # keys were already validated on the way into self
+            dict.__setitem__(new_config, key, value)
         return new_config
 
-    def __getitem__(self, key: str) -> t.Any:
-        try:
-            return dict.__getitem__(self, key)
-        except KeyError:
-            if _is_section_key(key):
-                c = Config()
-                dict.__setitem__(self, key, c)
-                return c
-            elif not key.startswith("_"):
-                # undefined, create lazy value, used for container methods
-                v = LazyConfigValue()
-                dict.__setitem__(self, key, v)
-                return v
-            else:
-                raise
+    def __missing__(self, key: str) -> t.Any:
+        # called by dict.__getitem__ for undefined keys
+        if _is_section_key(key):
+            c = Config()
+            dict.__setitem__(self, _intern_section_key(key), c)
+            return c
+        elif not key.startswith("_"):
+            # undefined, create lazy value, used for container methods
+            v = LazyConfigValue()
+            dict.__setitem__(self, key, v)
+            return v
+        else:
+            raise KeyError(key)
 
     def __setitem__(self, key: str, value: t.Any) -> None:
         if _is_section_key(key):
@@ -349,11 +402,13 @@ class Config(dict):  # type:ignore[type-arg]
                     "values whose keys begin with an uppercase "
                     f"char must be Config instances: {key!r}, {value!r}"
                 )
+            key = _intern_section_key(key)
         dict.__setitem__(self, key, value)
 
     def __getattr__(self, key: str) -> t.Any:
         if key.startswith("__"):
-            return dict.__getattr__(self, key)  # type:ignore[attr-defined]
+            # dict has no __getattr__ to defer to, so dunder lookups end here
+            raise AttributeError(key)
         try:
             return self.__getitem__(key)
         except KeyError as e:
@@ -605,6 +660,15 @@ class JSONFileConfigLoader(FileConfigLoader):
             f.write(json_config)
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_config_source(source: bytes, filename: str) -> types.CodeType:
+    """Compile the source of a Python config file
+
+    Cached on the exact source, so a file is only recompiled when its contents change.
+    """
+    return compile(source, filename, "exec")
+
+
 class PyFileConfigLoader(FileConfigLoader):
     """A config loader for pure python files.
 
@@ -652,7 +716,8 @@ class PyFileConfigLoader(FileConfigLoader):
         )
         conf_filename = self.full_filename
         with open(conf_filename, "rb") as f:
-            exec(compile(f.read(), conf_filename, "exec"), namespace, namespace)  # noqa: S102
+            code = _compile_config_source(f.read(), conf_filename)
+        exec(code, namespace, namespace)  # noqa: S102
 
 
 class CommandLineConfigLoader(ConfigLoader):
@@ -986,6 +1051,12 @@ class _FlagAction(argparse.Action):
             setattr(namespace, self.alias, values)
 
 
+@functools.lru_cache(maxsize=None)
+def _option_strings(key: str) -> tuple[str, ...]:
+    """The command-line option strings for a flag or alias name"""
+    return ("-" + key, "--" + key) if len(key) == 1 else ("--" + key,)
+
+
 class KVArgParseConfigLoader(ArgParseConfigLoader):
     """A config loader that loads aliases and flags with argparse,
 
@@ -1010,8 +1081,9 @@ class KVArgParseConfigLoader(ArgParseConfigLoader):
         #  Used also for aliases, not to re-collect them.
         self.argparse_traits = argparse_traits = {}
         for cls in classes:
+            cls_name = cls.__name__
             for traitname, trait in cls.class_traits(config=True).items():
-                argname = f"{cls.__name__}.{traitname}"
+                argname = f"{cls_name}.{traitname}"
                 argparse_kwds = {"type": str}
                 if isinstance(trait, (Container, Dict)):
                     multiplicity = trait.metadata.get("multiplicity", "append")
@@ -1028,38 +1100,43 @@ class KVArgParseConfigLoader(ArgParseConfigLoader):
                 if key in aliases:
                     alias_flags[aliases[key]] = value
                     continue
-                keys = ("-" + key, "--" + key) if len(key) == 1 else ("--" + key,)
-                paa(*keys, action=_FlagAction, flag=value, help=fhelp)
+                paa(*_option_strings(key), action=_FlagAction, flag=value, help=fhelp)
 
         for keys, traitname in aliases.items():
             if not isinstance(keys, tuple):
                 keys = (keys,)
 
+            # everything but the option string depends only on the alias target,
+            # so look it up once for all of its keys
+            dest = traitname.replace(".", _DOT_REPLACEMENT)
+            is_flag = traitname in alias_flags
+            target_kwds: dict[str, t.Any] = {}
+            argcompleter = None
+            if traitname in argparse_traits:
+                trait, target_kwds = argparse_traits[traitname]
+                # For argcomplete, check if any either an argcompleter metadata tag or method
+                # is available. If so, it should be a callable which takes the command-line key
+                # string as an argument and other kwargs passed by argcomplete,
+                # and returns the a list of string completions.
+                argcompleter = trait.metadata.get("argcompleter") or getattr(
+                    trait, "argcompleter", None
+                )
+
             for key in keys:
+                if is_flag and "action" in target_kwds:
+                    # flag sets 'action', so can't have flag & alias with custom action
+                    # on the same name
+                    raise ArgumentError(
+                        f"The alias `{key}` for the 'append' sequence "
+                        f"config-trait `{traitname}` cannot be also a flag!'"
+                    )
                 argparse_kwds = {
                     "type": str,
-                    "dest": traitname.replace(".", _DOT_REPLACEMENT),
+                    "dest": dest,
                     "metavar": traitname,
                 }
-                argcompleter = None
-                if traitname in argparse_traits:
-                    trait, kwds = argparse_traits[traitname]
-                    argparse_kwds.update(kwds)
-                    if "action" in argparse_kwds and traitname in alias_flags:
-                        # flag sets 'action', so can't have flag & alias with custom action
-                        # on the same name
-                        raise ArgumentError(
-                            f"The alias `{key}` for the 'append' sequence "
-                            f"config-trait `{traitname}` cannot be also a flag!'"
-                        )
-                    # For argcomplete, check if any either an argcompleter metadata tag or method
-                    # is available. If so, it should be a callable which takes the command-line key
-                    # string as an argument and other kwargs passed by argcomplete,
-                    # and returns the a list of string completions.
-                    argcompleter = trait.metadata.get("argcompleter") or getattr(
-                        trait, "argcompleter", None
-                    )
-                if traitname in alias_flags:
+                argparse_kwds.update(target_kwds)
+                if is_flag:
                     # alias and flag.
                     # when called with 0 args: flag
                     # when called with >= 1: alias
@@ -1067,8 +1144,7 @@ class KVArgParseConfigLoader(ArgParseConfigLoader):
                     argparse_kwds["action"] = _FlagAction
                     argparse_kwds["flag"] = alias_flags[traitname]
                     argparse_kwds["alias"] = traitname
-                keys = ("-" + key, "--" + key) if len(key) == 1 else ("--" + key,)
-                action = paa(*keys, **argparse_kwds)
+                action = paa(*_option_strings(key), **argparse_kwds)
                 if argcompleter is not None:
                     # argcomplete's completers are callables returning list of completion strings
                     action.completer = functools.partial(  # type:ignore[attr-defined]
@@ -1078,6 +1154,8 @@ class KVArgParseConfigLoader(ArgParseConfigLoader):
     def _convert_to_config(self) -> None:
         """self.parsed_data->self.config, parse unrecognized extra args via KVLoader."""
         extra_args = self.extra_args
+        get_trait = self.argparse_traits.get
+        exec_config_str = self._exec_config_str
 
         for lhs, rhs in vars(self.parsed_data).items():
             if lhs == "extra_args":
@@ -1097,13 +1175,13 @@ class KVArgParseConfigLoader(ArgParseConfigLoader):
             elif isinstance(rhs, str):
                 rhs = DeferredConfigString(rhs)
 
-            trait = self.argparse_traits.get(lhs)
+            trait = get_trait(lhs)
             if trait:
                 trait = trait[0]
 
             # eval the KV assignment
             try:
-                self._exec_config_str(lhs, rhs, trait)
+                exec_config_str(lhs, rhs, trait)
             except Exception as e:
                 # cast deferred to nicer repr for the error
                 # DeferredList->list, etc
@@ -1125,6 +1203,9 @@ class KVArgParseConfigLoader(ArgParseConfigLoader):
 
     def _argcomplete(self, classes: list[t.Any], subcommands: SubcommandsDict | None) -> None:
         """If argcomplete is enabled, allow triggering command-line autocompletion"""
+        if "_ARGCOMPLETE" not in os.environ:
+            # not completing, don't bother importing argcomplete
+            return
         try:
             import argcomplete  # noqa: F401
         except ImportError:
@@ -1133,7 +1214,7 @@ class KVArgParseConfigLoader(ArgParseConfigLoader):
         from . import argcomplete_config
 
         finder = argcomplete_config.ExtendedCompletionFinder()  # type:ignore[no-untyped-call]
-        finder.config_classes = classes
+        finder.config_classes = tuple(classes)
         finder.subcommands = list(subcommands or [])
         # for ease of testing, pass through self._argcomplete_kwargs if set
         finder(self.parser, **getattr(self, "_argcomplete_kwargs", {}))
@@ -1171,9 +1252,6 @@ def load_pyconfig_files(config_files: list[str], path: str) -> Config:
         try:
             next_config = loader.load_config()
         except ConfigFileNotFound:
-            pass
-        except Exception:
-            raise
-        else:
-            config.merge(next_config)
+            continue
+        config.merge(next_config)
     return config
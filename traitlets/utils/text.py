@@ -6,12 +6,15 @@ from __future__ import annotations
 import re
 import textwrap
 from textwrap import dedent
-from textwrap import indent as _indent
 from typing import List
 
+_PARAGRAPH_RE = re.compile(r"\n(\s*\n)+", re.MULTILINE)
+_INDENT_RE = re.compile(r"\n\s+", re.MULTILINE)
+
 
 def indent(val: str) -> str:
-    return _indent(val, "    ")
+    # same as textwrap.indent(val, "    "), without a predicate call per line
+    return "".join("    " + line if line.strip() else line for line in val.splitlines(True))
 
 
 def wrap_paragraphs(text: str, ncols: int = 80) -> List[str]:
@@ -25,15 +28,13 @@ def wrap_paragraphs(text: str, ncols: int = 80) -> List[str]:
 
     list of complete paragraphs, wrapped to fill `ncols` columns.
     """
-    paragraph_re = re.compile(r"\n(\s*\n)+", re.MULTILINE)
     text = dedent(text).strip()
-    paragraphs = paragraph_re.split(text)[::2]  # every other entry is space
+    paragraphs = _PARAGRAPH_RE.split(text)[::2]  # every other entry is space
     out_ps = []
-    indent_re = re.compile(r"\n\s+", re.MULTILINE)
     for p in paragraphs:
         # presume indentation that survives dedent is meaningful formatting,
         # so don't fill unless text is flush.
-        if indent_re.search(p) is None:
+        if _INDENT_RE.search(p) is None:
             # wrap paragraph
             p = textwrap.fill(p, ncols)
         out_ps.append(p)